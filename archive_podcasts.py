@@ -2,20 +2,66 @@
 
 import argparse
 import asyncio
+import calendar
+import contextlib
 import aiohttp
-import aiofiles
-import feedparser
-import json
+import orjson
+import email.utils
+import functools
+import io
 import os
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
-import urllib.parse
+from typing import Optional, List, Dict, Any, Tuple, BinaryIO
+from dataclasses import dataclass
 from tqdm import tqdm
 import time
+import xml.etree.ElementTree as ET
+
+# uvloop is optional; when installed it replaces the default event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Read size for streaming episode downloads. Large chunks keep the number of
+# event-loop wakeups and write calls low for multi-megabyte audio files.
+CHUNK_SIZE = 256 * 1024
+
+# Buffer size for the episode file handle. Local disk writes are not truly
+# asynchronous, so plain buffered writes beat bouncing through a thread pool.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Network chunks are collected in a per-worker buffer of this size and flushed
+# to disk when it fills, so short reads never turn into tiny writes.
+FLUSH_THRESHOLD = 8 * 1024 * 1024
+
+# Progress bar updates are batched and pushed to tqdm at most this often
+# (seconds), or whenever 1/200th of the episode has arrived
+PROGRESS_INTERVAL = 0.25
+
+# Patterns used by sanitize_filename
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# First byte offset of a 206 response's Content-Range header, and the full
+# length reported by a 416 response's
+_CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-')
+_UNSATISFIED_RANGE_RE = re.compile(r'bytes \*/(\d+)')
+
+# ISO 8601 style dates (Atom feeds, some hand-written RSS) start with the date
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# XML namespaces used by podcast feeds
+ITUNES_NS = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+
+# Tags that hold a single episode and the feed-level container around them
+_ENTRY_TAGS = ('item', f'{ATOM_NS}entry')
+_CHANNEL_TAGS = ('channel', f'{ATOM_NS}feed')
 
 
 @dataclass
@@ -30,93 +76,266 @@ class EpisodeMetadata:
     guid: Optional[str]
     link: Optional[str]
     categories: List[str]
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class Feed:
+    """A parsed podcast feed"""
+    title: Optional[str]
+    entries: List[Dict[str, Any]]
 
 
 def sanitize_filename(title: str) -> str:
     """Sanitize a title for use as a filename"""
-    # Replace invalid filename characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    title = re.sub(invalid_chars, '_', title)
-    
-    # Replace newlines, tabs, etc. with spaces
-    title = re.sub(r'[\n\r\t]', ' ', title)
-    
-    # Normalize whitespace
-    title = ' '.join(title.split())
-    
-    return title.strip()
+    # Replace invalid filename characters, then collapse newlines, tabs and
+    # runs of whitespace into single spaces
+    title = _INVALID_CHARS_RE.sub('_', title)
+    return _WHITESPACE_RE.sub(' ', title).strip()
+
+
+def format_date_prefix(year: int, month: int, day: int) -> str:
+    """Return a YYYY-MM-DD filename prefix, or an empty string for impossible dates"""
+    if not (1 <= year <= 9999 and 1 <= month <= 12):
+        return ""
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return ""
+    return f"{year:04d}-{month:02d}-{day:02d} - "
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> str:
     """Parse date string and return YYYY-MM-DD format"""
     if not date_str:
         return ""
     
-    # Try different date formats
-    date_formats = [
-        '%a, %d %b %Y %H:%M:%S %z',
-        '%a, %d %b %Y %H:%M:%S %Z',
-        '%Y-%m-%d %H:%M:%S',
-        '%Y-%m-%d',
-    ]
-    
-    for fmt in date_formats:
-        try:
-            parsed_date = datetime.strptime(date_str, fmt)
-            return parsed_date.strftime('%Y-%m-%d - ')
-        except ValueError:
-            continue
+    match = _ISO_DATE_RE.match(date_str)
+    if match:
+        year, month, day = match.groups()
+        return format_date_prefix(int(year), int(month), int(day))
     
-    return ""
+    # Anything else should be an RFC 822 date, which virtually every RSS feed
+    # uses. parsedate_tz returns None rather than raising on bad input.
+    parsed = email.utils.parsedate_tz(date_str)
+    if parsed is None:
+        return ""
+    return format_date_prefix(parsed[0], parsed[1], parsed[2])
 
 
 def get_file_extension(url: str) -> str:
     """Extract file extension from URL"""
-    parsed = urllib.parse.urlparse(url)
-    path = parsed.path
-    ext = os.path.splitext(path)[1]
-    return ext[1:] if ext else "mp3"  # Default to mp3
+    # Drop the query string and fragment, then the scheme and host so a dot in
+    # the domain is never mistaken for an extension
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    scheme_end = path.find('://')
+    if scheme_end != -1:
+        slash = path.find('/', scheme_end + 3)
+        path = path[slash:] if slash != -1 else ''
+    
+    name = path[path.rfind('/') + 1:]
+    dot = name.rfind('.')
+    return name[dot + 1:] if 0 < dot < len(name) - 1 else "mp3"  # Default to mp3
 
 
-def extract_metadata(entry) -> EpisodeMetadata:
-    """Extract metadata from a feed entry"""
-    # Get iTunes duration if available
-    duration = None
-    if hasattr(entry, 'itunes_duration'):
-        duration = entry.itunes_duration
+def _child_text(elem: ET.Element, *tags: str) -> Optional[str]:
+    """Return the stripped text of the first matching child element"""
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+def _parse_entry(elem: ET.Element) -> Dict[str, Any]:
+    """Convert an RSS <item> or Atom <entry> element into a plain dict"""
+    enclosure_url = None
+    link = _child_text(elem, 'link')
+    
+    enclosure = elem.find('enclosure')
+    if enclosure is not None:
+        enclosure_url = enclosure.get('url')
+    
+    # Atom keeps both the enclosure and the episode page in <link> elements
+    for atom_link in elem.iterfind(f'{ATOM_NS}link'):
+        rel = atom_link.get('rel', 'alternate')
+        if rel == 'enclosure' and not enclosure_url:
+            enclosure_url = atom_link.get('href')
+        elif rel == 'alternate' and not link:
+            link = atom_link.get('href')
     
-    # Get categories
-    categories = []
-    if hasattr(entry, 'tags'):
-        categories = [tag.term for tag in entry.tags if hasattr(tag, 'term')]
+    categories = [c.text.strip() for c in elem.iterfind('category') if c.text and c.text.strip()]
+    categories += [c.get('term') for c in elem.iterfind(f'{ATOM_NS}category') if c.get('term')]
     
+    return {
+        'title': _child_text(elem, 'title', f'{ATOM_NS}title'),
+        'summary': _child_text(elem, 'description', f'{ITUNES_NS}summary', f'{ATOM_NS}summary', f'{ATOM_NS}content'),
+        'published': _child_text(elem, 'pubDate', f'{ATOM_NS}published', f'{ATOM_NS}updated', f'{DC_NS}date'),
+        'duration': _child_text(elem, f'{ITUNES_NS}duration'),
+        'author': _child_text(elem, f'{ITUNES_NS}author', 'author', f'{DC_NS}creator', f'{ATOM_NS}author/{ATOM_NS}name'),
+        'enclosure_url': enclosure_url,
+        'guid': _child_text(elem, 'guid', f'{ATOM_NS}id'),
+        'link': link,
+        'categories': categories,
+    }
+
+
+def parse_feed(source) -> Feed:
+    """Parse an RSS or Atom feed from a file-like object"""
+    title = None
+    entries = []
+    path = []
+    
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            path.append(elem.tag)
+            continue
+        
+        path.pop()
+        if elem.tag in _ENTRY_TAGS:
+            entries.append(_parse_entry(elem))
+            # Drop the element's children now that we've read what we need
+            elem.clear()
+        elif title is None and path and path[-1] in _CHANNEL_TAGS and elem.tag in ('title', f'{ATOM_NS}title'):
+            title = (elem.text or '').strip() or None
+    
+    return Feed(title=title, entries=entries)
+
+
+def extract_metadata(entry: Dict[str, Any]) -> EpisodeMetadata:
+    """Extract metadata from a feed entry"""
     return EpisodeMetadata(
-        title=entry.title or "Unknown Title",
-        description=getattr(entry, 'summary', None),
-        pub_date=getattr(entry, 'published', None),
-        duration=duration,
-        author=getattr(entry, 'author', None),
-        file_url=entry.enclosures[0].href if entry.enclosures else "",
-        guid=getattr(entry, 'id', None),
-        link=getattr(entry, 'link', None),
-        categories=categories
+        title=entry.get('title') or "Unknown Episode",
+        description=entry.get('summary'),
+        pub_date=entry.get('published'),
+        duration=entry.get('duration'),
+        author=entry.get('author'),
+        file_url=entry.get('enclosure_url') or "",
+        guid=entry.get('guid'),
+        link=entry.get('link'),
+        categories=entry.get('categories', [])
     )
 
 
-async def save_metadata(metadata: EpisodeMetadata, output_dir: str, filename: str):
-    """Save episode metadata as JSON file"""
+def prepare_episode(entry: Dict[str, Any]) -> Tuple[str, EpisodeMetadata]:
+    """Work out the filename and metadata for a feed entry"""
+    metadata = extract_metadata(entry)
+    
+    # Get file extension
+    original_extension = get_file_extension(metadata.file_url)
+    
+    # Sanitize episode title
+    sanitized_title = sanitize_filename(metadata.title)
+    
+    # Get publication date for filename prefix
+    date_prefix = parse_date(metadata.pub_date)
+    
+    # Create filename
+    filename = f"{date_prefix}{sanitized_title}.{original_extension}"
+    
+    return filename, metadata
+
+
+def prepare_episodes(entries: List[Dict[str, Any]]) -> List[Tuple[str, EpisodeMetadata]]:
+    """Prepare the filename and metadata for every entry"""
+    return [prepare_episode(entry) for entry in entries]
+
+
+async def fetch_feed(url: str) -> Feed:
+    """Download an RSS feed and parse it"""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            raw = await response.read()
+    
+    return parse_feed(io.BytesIO(raw))
+
+
+def get_metadata_path(output_dir: str, filename: str) -> str:
+    """Return the path of the JSON metadata file for an episode"""
+    # Create metadata filename by replacing extension with .json
+    base_name = os.path.splitext(filename)[0]
+    return os.path.join(output_dir, f"{base_name}.json")
+
+
+def save_metadata(
+    metadata: EpisodeMetadata,
+    output_dir: str,
+    filename: str,
+    metadata_log: Optional[BinaryIO] = None
+):
+    """Save episode metadata as a JSON file, or as a line in the shared metadata log"""
     try:
-        # Create metadata filename by replacing extension with .json
-        base_name = os.path.splitext(filename)[0]
-        metadata_filename = f"{base_name}.json"
-        metadata_path = os.path.join(output_dir, metadata_filename)
+        # orjson serializes dataclasses directly, without an asdict() copy
+        if metadata_log is not None:
+            metadata_log.write(orjson.dumps(metadata) + b'\n')
+            return
         
-        # Convert to dict and save as pretty JSON
-        metadata_dict = asdict(metadata)
-        async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(metadata_dict, indent=2, ensure_ascii=False))
+        # Save as pretty JSON next to the episode
+        with open(get_metadata_path(output_dir, filename), 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     except Exception as e:
-        print(f"Warning: Failed to save metadata for {filename}: {e}")
+        tqdm.write(f"Warning: Failed to save metadata for {filename}: {e}")
+
+
+def get_validator(headers) -> Optional[str]:
+    """Return the value identifying this version of a file for If-Range"""
+    # If-Range only accepts strong ETags; fall back to Last-Modified
+    etag = headers.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('last-modified')
+
+
+def get_validator_path(part_path: str) -> str:
+    """Return the path that records which version of a file a .part file holds"""
+    return f"{part_path}.validator"
+
+
+def save_validator(part_path: str, validator: Optional[str]):
+    """Record the validator for a .part file, or forget a stale one"""
+    validator_path = get_validator_path(part_path)
+    if validator:
+        with open(validator_path, 'w', encoding='utf-8') as f:
+            f.write(validator)
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(validator_path)
+
+
+def load_validator(part_path: str) -> Optional[str]:
+    """Return the validator a .part file was started from"""
+    try:
+        with open(get_validator_path(part_path), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def discard_partial(part_path: str):
+    """Remove a .part file that can't be resumed, along with its validator"""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(part_path)
+    save_validator(part_path, None)
+
+
+def complete_download(
+    part_path: str,
+    file_path: str,
+    last_modified: Optional[str] = None,
+    metadata: Optional[EpisodeMetadata] = None,
+    metadata_log: Optional[BinaryIO] = None
+):
+    """Move a finished .part file into place, then record the episode's metadata"""
+    os.replace(part_path, file_path)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(get_validator_path(part_path))
+    
+    # Metadata is only written once the episode is in place, so failed or
+    # resumed attempts never leave duplicate entries in the metadata log
+    if metadata is not None:
+        metadata.last_modified = last_modified
+        output_dir, filename = os.path.split(file_path)
+        save_metadata(metadata, output_dir, filename, metadata_log)
 
 
 async def download_episode(
@@ -126,60 +345,166 @@ async def download_episode(
     output_dir: str,
     episode_index: int,
     total_episodes: int,
-    semaphore: asyncio.Semaphore,
+    progress_bar: tqdm,
+    buffer: bytearray,
     save_metadata_flag: bool,
-    metadata: Optional[EpisodeMetadata] = None
+    metadata: Optional[EpisodeMetadata] = None,
+    partial: bool = False,
+    metadata_log: Optional[BinaryIO] = None
 ) -> bool:
-    """Download a single episode with progress tracking"""
-    async with semaphore:
-        file_path = os.path.join(output_dir, filename)
-        
-        # Check if file already exists
-        if os.path.exists(file_path):
-            print(f"[{episode_index + 1}/{total_episodes}] Skipping (already exists): {filename}")
-            return True
+    """Download a single episode with progress tracking, resuming partial files"""
+    file_path = os.path.join(output_dir, filename)
+    
+    # Episodes are downloaded to a .part file and only renamed into place once
+    # the whole body has been written, or once a resumed .part file is shown
+    # to match the server's copy (same validator and length). A file under
+    # the final name is therefore a complete episode.
+    part_path = f"{file_path}.part"
+    
+    # Audio is already compressed, so don't ask for a gzip transfer
+    headers = {'Accept-Encoding': 'identity'}
+    
+    # Metadata to record once the episode is complete
+    if not save_metadata_flag:
+        metadata = None
+    
+    try:
+        # A .part file left by an interrupted run is resumed from where it
+        # stopped, but only if the server still has the same version of the
+        # file. Without a recorded validator the download starts over.
+        local_size = os.path.getsize(part_path) if partial else 0
+        validator = load_validator(part_path) if local_size > 0 else None
+        if validator:
+            # An error page's headers say nothing about the episode
+            async with session.head(url, headers=headers, allow_redirects=True) as head:
+                unchanged = head.status == 200 and get_validator(head.headers) == validator
+                remote_size = int(head.headers.get('content-length', 0)) if unchanged else 0
+                last_modified = head.headers.get('last-modified')
+            
+            if local_size == remote_size:
+                complete_download(part_path, file_path, last_modified, metadata, metadata_log)
+                tqdm.write(f"[{episode_index + 1}/{total_episodes}] Finished: {filename}")
+                return True
+            
+            if local_size < remote_size:
+                headers['Range'] = f'bytes={local_size}-'
+                headers['If-Range'] = validator
         
-        try:
-            # Create progress bar
-            progress_bar = tqdm(
-                total=0,
-                desc=f"[{episode_index + 1}/{total_episodes}] {filename}",
-                unit='B',
-                unit_scale=True,
-                unit_divisor=1024,
-                leave=False
-            )
+        async with session.get(url, headers=headers) as response:
+            resuming = 'Range' in headers
             
-            async with session.get(url) as response:
-                if response.status != 200:
-                    print(f"Error downloading {filename}: HTTP {response.status}")
-                    return False
-
-                # Save metadata if enabled
-                if save_metadata_flag and metadata:
-                    await save_metadata(metadata, output_dir, filename)                   
-                
-                # Get file size for progress bar
-                total_size = int(response.headers.get('content-length', 0))
-                if total_size > 0:
-                    progress_bar.total = total_size
+            if response.status == 416:
+                # Nothing left to fetch past the end of the partial file, but
+                # only if the server's full length is exactly what we hold
+                match = _UNSATISFIED_RANGE_RE.match(response.headers.get('content-range', ''))
+                if resuming and match and int(match.group(1)) == local_size:
+                    complete_download(part_path, file_path, response.headers.get('last-modified'), metadata, metadata_log)
+                    tqdm.write(f"[{episode_index + 1}/{total_episodes}] Finished: {filename}")
+                    return True
                 
-                # Download file
-                downloaded = 0
-                async with aiofiles.open(file_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        await f.write(chunk)
-                        downloaded += len(chunk)
-                        progress_bar.update(len(chunk))
-                
-                progress_bar.close()
-                
-                print(f"[{episode_index + 1}/{total_episodes}] Finished: {filename}")
-                return True
+                tqdm.write(f"Error downloading {filename}: HTTP 416, discarding partial file")
+                discard_partial(part_path)
+                return False
+            
+            if response.status == 206:
+                # Only append if the server resumed exactly where the file ends;
+                # otherwise start over on the next run
+                match = _CONTENT_RANGE_RE.match(response.headers.get('content-range', ''))
+                if not resuming or not match or int(match.group(1)) != local_size:
+                    tqdm.write(f"Error downloading {filename}: unexpected Content-Range, discarding partial file")
+                    discard_partial(part_path)
+                    return False
+                mode = 'ab'
+            elif response.status == 200:
+                mode = 'wb'
+                # Remember which version of the file this .part holds so a
+                # later run only resumes it if it hasn't changed upstream
+                save_validator(part_path, get_validator(response.headers))
+            else:
+                tqdm.write(f"Error downloading {filename}: HTTP {response.status}")
+                return False
+            
+            # Grow the shared progress bar by the number of bytes still to come
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size > 0:
+                progress_bar.total += total_size
+                progress_bar.refresh()
+            
+            # Download file. Chunks are copied into the worker's preallocated
+            # buffer and written out whenever the next chunk would not fit
+            downloaded = 0
+            filled = 0
+            view = memoryview(buffer)
+            pending = 0
+            update_threshold = total_size // 200 if total_size > 0 else FLUSH_THRESHOLD
+            last_update = time.monotonic()
+            with open(part_path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    size = len(chunk)
+                    if filled + size > len(buffer):
+                        f.write(view[:filled])
+                        filled = 0
+                    view[filled:filled + size] = chunk
+                    filled += size
+                    downloaded += size
+                    
+                    pending += size
+                    now = time.monotonic()
+                    if pending >= update_threshold or now - last_update >= PROGRESS_INTERVAL:
+                        progress_bar.update(pending)
+                        pending = 0
+                        last_update = now
                 
-        except Exception as e:
-            print(f"Error downloading {filename}: {e}")
-            return False
+                # Flush whatever is left after the last chunk
+                if filled:
+                    f.write(view[:filled])
+                if pending:
+                    progress_bar.update(pending)
+            
+            complete_download(part_path, file_path, response.headers.get('last-modified'), metadata, metadata_log)
+            status = "Resumed" if mode == 'ab' else "Finished"
+            tqdm.write(f"[{episode_index + 1}/{total_episodes}] {status}: {filename}")
+            return True
+            
+    except Exception as e:
+        tqdm.write(f"Error downloading {filename}: {e}")
+        return False
+
+
+async def download_worker(
+    session: aiohttp.ClientSession,
+    queue: asyncio.Queue,
+    results: List[bool],
+    output_dir: str,
+    total_episodes: int,
+    progress_bar: tqdm,
+    save_metadata_flag: bool,
+    metadata_log: Optional[BinaryIO] = None
+):
+    """Download queued episodes one at a time until cancelled"""
+    # Each worker reuses a single write buffer for every episode it downloads
+    buffer = bytearray(FLUSH_THRESHOLD)
+    
+    while True:
+        item = await queue.get()
+        try:
+            result = await download_episode(
+                session=session,
+                url=item['url'],
+                filename=item['filename'],
+                output_dir=output_dir,
+                episode_index=item['index'],
+                total_episodes=total_episodes,
+                progress_bar=progress_bar,
+                buffer=buffer,
+                save_metadata_flag=save_metadata_flag,
+                metadata=item['metadata'],
+                partial=item['partial'],
+                metadata_log=metadata_log
+            )
+            results.append(result)
+        finally:
+            queue.task_done()
 
 
 async def main():
@@ -199,6 +524,7 @@ Examples:
     parser.add_argument('-c', '--count', type=int, help='Number of episodes to download')
     parser.add_argument('-t', '--threads', type=int, default=1, help='Number of concurrent downloads (default: 1)')
     parser.add_argument('-m', '--metadata', action='store_true', help='Save episode metadata as JSON files')
+    parser.add_argument('--metadata-jsonl', action='store_true', help='Append episode metadata to a single podcast.jsonl instead of one JSON file per episode')
     
     args = parser.parse_args()
     
@@ -206,13 +532,13 @@ Examples:
     
     # Parse RSS feed
     print(f"Fetching RSS feed: {args.url}")
-    feed = feedparser.parse(args.url)
+    feed = await fetch_feed(args.url)
     
     if not feed.entries:
         print("Error: No episodes found in RSS feed")
         return
     
-    podcast_title = feed.feed.title if hasattr(feed.feed, 'title') else "Unknown Podcast"
+    podcast_title = feed.title or "Unknown Podcast"
     print(f"[{podcast_title}] Found {len(feed.entries)} episodes")
     
     # Create output directory
@@ -222,7 +548,7 @@ Examples:
     # Filter episodes with enclosures
     episodes_with_enclosures = []
     for entry in feed.entries:
-        if entry.enclosures:
+        if entry['enclosure_url']:
             episodes_with_enclosures.append(entry)
     
     if not episodes_with_enclosures:
@@ -235,67 +561,98 @@ Examples:
     
     print(f"Downloading {len(episodes_to_download)} episodes with {args.threads} threads")
     
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(args.threads)
+    save_metadata_flag = args.metadata or args.metadata_jsonl
     
-    # Prepare download tasks
-    tasks = []
-    async with aiohttp.ClientSession() as session:
-        for i, entry in enumerate(episodes_to_download):
-            if i >= max_episodes:
-                break
-            
-            enclosure = entry.enclosures[0]
-            url = enclosure.href
-            
-            # Get file extension
-            original_extension = get_file_extension(url)
-            
-            # Get episode title and sanitize
-            episode_title = entry.title or "Unknown Episode"
-            sanitized_title = sanitize_filename(episode_title)
+    # Build filenames and metadata off the event loop in one batch
+    loop = asyncio.get_running_loop()
+    prepared = await loop.run_in_executor(None, prepare_episodes, episodes_to_download)
+    
+    # Snapshot the output directory once. Files under their final name were
+    # only ever renamed there complete, so they are skipped outright; leftover
+    # .part files are resumed or restarted by the workers
+    with os.scandir(podcast_dir) as entries:
+        existing_files = {entry.name for entry in entries if entry.is_file()}
+    skipped = 0
+    
+    # A fixed pool of workers drains a bounded queue, so the number of
+    # in-flight downloads is capped by the worker count
+    queue = asyncio.Queue(maxsize=args.threads * 2)
+    results = []
+    
+    # One progress bar tracks the bytes downloaded across all episodes; its
+    # total grows as each download reports its size
+    progress_bar = tqdm(total=0, unit='B', unit_scale=True, unit_divisor=1024, desc=podcast_title)
+    
+    # Episodes usually live on a single CDN host, so keep enough connections
+    # alive per host for every worker to reuse its own
+    connector = aiohttp.TCPConnector(
+        limit=args.threads,
+        limit_per_host=args.threads,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    )
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+    
+    # With --metadata-jsonl, every episode's metadata goes into one shared file
+    metadata_log_path = os.path.join(podcast_dir, 'podcast.jsonl')
+    with (open(metadata_log_path, 'ab') if args.metadata_jsonl else contextlib.nullcontext()) as metadata_log:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            workers = [
+                asyncio.create_task(download_worker(
+                    session=session,
+                    queue=queue,
+                    results=results,
+                    output_dir=podcast_dir,
+                    total_episodes=len(episodes_to_download),
+                    progress_bar=progress_bar,
+                    save_metadata_flag=save_metadata_flag,
+                    metadata_log=metadata_log
+                ))
+                for _ in range(args.threads)
+            ]
             
-            # Get publication date for filename prefix
-            date_prefix = parse_date(getattr(entry, 'published', None))
+            for i, (filename, metadata) in enumerate(prepared):
+                # Skip episodes that were downloaded on a previous run
+                if filename in existing_files:
+                    tqdm.write(f"[{i + 1}/{len(prepared)}] Skipping (already exists): {filename}")
+                    skipped += 1
+                    continue
+                
+                # Queue the episode for the next free worker
+                await queue.put({
+                    'url': metadata.file_url,
+                    'filename': filename,
+                    'metadata': metadata,
+                    'index': i,
+                    'partial': f"{filename}.part" in existing_files,
+                })
             
-            # Create filename
-            filename = f"{date_prefix}{sanitized_title}.{original_extension}"
+            # Wait for the queue to drain, then shut the workers down
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            progress_bar.close()
             
-            # Extract metadata if needed
-            metadata = None
-            if args.metadata:
-                metadata = extract_metadata(entry)
+            # Count successful downloads
+            successful = sum(1 for result in results if result is True)
+            failed = len(results) - successful
             
-            # Create download task
-            task = download_episode(
-                session=session,
-                url=url,
-                filename=filename,
-                output_dir=podcast_dir,
-                episode_index=i,
-                total_episodes=len(episodes_to_download),
-                semaphore=semaphore,
-                save_metadata_flag=args.metadata,
-                metadata=metadata
-            )
-            tasks.append(task)
-        
-        # Execute all downloads concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Count successful downloads
-        successful = sum(1 for result in results if result is True)
-        failed = len(results) - successful
-        
-        print(f"\nDownload complete!")
-        print(f"Successfully downloaded: {successful}")
-        if failed > 0:
-            print(f"Failed downloads: {failed}")
+            print(f"\nDownload complete!")
+            print(f"Successfully downloaded: {successful}")
+            if skipped > 0:
+                print(f"Skipped (already exists): {skipped}")
+            if failed > 0:
+                print(f"Failed downloads: {failed}")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # uvloop.run() only exists in uvloop 0.18 and later
+        if uvloop is not None and hasattr(uvloop, 'run'):
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nDownload interrupted by user")
         sys.exit(1)